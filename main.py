@@ -1,65 +1,371 @@
-from fastapi import FastAPI, Query, HTTPException, Response, Request
+from fastapi import FastAPI, Query, Header, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.dependencies.utils import request_params_to_args
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from starlette.routing import Match
 import sqlite3
-import requests
+import aiosqlite
+import httpx
+from cachetools import TTLCache
+import orjson
 from typing import Optional
 import time
 import os
-
-app = FastAPI(
-    title="News Scraper API",
-    description="REST API for accessing scraped news articles",
-    version="1.0.0"
-)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+import json
+import hashlib
+import asyncio
+from contextlib import asynccontextmanager
+from itertools import repeat
 
 # Use direct download URL instead of API (no rate limits!)
 DB_DOWNLOAD_URL = "https://raw.githubusercontent.com/yashsinghall/news_scrapper_safe/main/news_articles.db"
 
 # Cache settings
-DB_CACHE_FILE = "/tmp/news_articles_cached.db"
+# /dev/shm must fit the old cache file plus the new one with its indexes;
+# Docker's default 64 MiB /dev/shm falls below this and uses /tmp instead
+SHM_MIN_FREE_BYTES = 256 * 1024 * 1024
+
+def pick_cache_dir():
+    """Prefer a RAM-backed /dev/shm so reads never touch disk, if it's writable and roomy"""
+    override = os.environ.get("DB_CACHE_DIR")
+    if override:
+        return override
+    try:
+        stat = os.statvfs("/dev/shm")
+    except OSError:
+        return "/tmp"
+    if os.access("/dev/shm", os.W_OK) and stat.f_bavail * stat.f_frsize >= SHM_MIN_FREE_BYTES:
+        return "/dev/shm"
+    return "/tmp"
+
+DB_CACHE_DIR = pick_cache_dir()
+DB_CACHE_FILE = os.path.join(DB_CACHE_DIR, "news_articles_cached.db")
+DB_META_FILE = DB_CACHE_FILE + ".meta"
 CACHE_DURATION = 60  # 1 min
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
 last_fetch_time = 0
+# True once the shared connection serves a cache file that's been checked
+# (downloaded, revalidated, or kept after a failed refresh)
+_cache_valid = False
+
+def load_db_meta():
+    """Read the ETag/Last-Modified validators saved with the cache file"""
+    if not os.path.exists(DB_CACHE_FILE):
+        return None, None
+    try:
+        with open(DB_META_FILE) as f:
+            meta = json.load(f)
+        return meta.get("etag"), meta.get("last_modified")
+    except (OSError, ValueError):
+        return None, None
+
+def save_db_meta(etag, last_modified):
+    """Persist the validators so a restarted process can still revalidate"""
+    with open(DB_META_FILE, 'w') as f:
+        json.dump({"etag": etag, "last_modified": last_modified}, f)
+
+db_etag, db_last_modified = load_db_meta()
+
+# SQL is built once at import; SQLite then reuses the prepared statements
+# from the shared connection's statement cache. 'summary' is exposed as 'content'.
+ARTICLE_COLUMNS = "id, source, title, url, summary AS content, image_url, scraped_at"
+ARTICLE_KEYS = ("id", "source", "title", "url", "content", "image_url", "scraped_at")
+
+SQL_LATEST = f"SELECT {ARTICLE_COLUMNS} FROM news ORDER BY scraped_at DESC LIMIT ?"
+SQL_SOURCES = "SELECT DISTINCT source FROM news ORDER BY source"
+SQL_STATS_SUMMARY = (
+    "SELECT (SELECT COUNT(*) FROM news), (SELECT MAX(scraped_at) FROM news), (SELECT MIN(scraped_at) FROM news)"
+)
+SQL_STATS_BY_SOURCE = "SELECT source, COUNT(*) as count FROM news GROUP BY source ORDER BY count DESC"
+SQL_BY_SOURCE = f"SELECT {ARTICLE_COLUMNS} FROM news WHERE source = ? ORDER BY scraped_at DESC LIMIT ?"
 
-def get_db():
-    """Download database from GitHub with caching (uses raw URL, no API limits)"""
-    global last_fetch_time
+def build_articles_sql(has_source, search_mode):
+    """Build the /articles query for a given combination of filters"""
+    query = f"SELECT {ARTICLE_COLUMNS} FROM news WHERE 1=1"
+    if has_source:
+        query += " AND source = ?"
+    if search_mode == "fts":
+        query += " AND id IN (SELECT rowid FROM news_fts WHERE news_fts MATCH ?)"
+    elif search_mode == "prefix":
+        # No leading wildcard, so SQLite can range-scan idx_title_nocase
+        query += " AND title LIKE ? ESCAPE '\\'"
+    elif search_mode == "like":
+        # The search still uses 'summary' for the database query, but the output key is 'content'
+        query += " AND (title LIKE ? OR summary LIKE ?)"
+    return query + " ORDER BY scraped_at DESC LIMIT ?"
+
+# /articles variants keyed by (has_source, has_search); search goes through FTS5
+SQL_ARTICLES = {
+    (has_source, has_search): build_articles_sql(has_source, "fts" if has_search else None)
+    for has_source in (False, True)
+    for has_search in (False, True)
+}
+# LIKE fallback for files without news_fts or searches with no words, keyed by has_source
+SQL_ARTICLES_LIKE = {has_source: build_articles_sql(has_source, "like") for has_source in (False, True)}
+SQL_ARTICLES_PREFIX = {has_source: build_articles_sql(has_source, "prefix") for has_source in (False, True)}
+
+# Read-only workload against a local cache file: WAL, mmap and a larger page cache
+DB_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-64000;
+PRAGMA query_only=1;
+"""
+
+# Indexes for the ORDER BY scraped_at DESC LIMIT queries and title prefix
+# search, built once per download
+DB_BOOTSTRAP = """
+CREATE INDEX IF NOT EXISTS idx_scraped ON news(scraped_at DESC);
+CREATE INDEX IF NOT EXISTS idx_source_scraped ON news(source, scraped_at DESC);
+CREATE INDEX IF NOT EXISTS idx_title_nocase ON news(title COLLATE NOCASE);
+ANALYZE;
+"""
+
+# Full-text index over title/summary for /articles?search=
+DB_BOOTSTRAP_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(title, summary, content='news', content_rowid='id');
+INSERT INTO news_fts(news_fts) VALUES('rebuild');
+"""
+
+async def bootstrap_db(path):
+    """Add query indexes to a freshly downloaded database file"""
+    async with aiosqlite.connect(path) as conn:
+        await conn.executescript(DB_BOOTSTRAP)
+        try:
+            await conn.executescript(DB_BOOTSTRAP_FTS)
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5; search falls back to LIKE
+            pass
+
+async def connect_db():
+    """Open the cached database with read-tuned PRAGMAs applied"""
+    conn = await aiosqlite.connect(DB_CACHE_FILE)
+    await conn.executescript(DB_PRAGMAS)
+    return conn
+
+# Process-wide connection shared by all requests, swapped on refresh
+_conn = None
+_retired_conn = None
+# /articles/stats, and the encoded /articles/sources and /articles/stats
+# bodies, computed once per connection swap
+_cached_stats = None
+_sources_body = None
+_source_names = frozenset()
+_stats_body = None
+# Bumped on every swap; part of every response_cache key
+_db_version = 0
+_refresh_lock = asyncio.Lock()
+
+# Encoded JSON bodies of hot endpoints, keyed by (_db_version, endpoint, params)
+response_cache = TTLCache(maxsize=256, ttl=CACHE_DURATION)
+
+# Follow redirects like requests did, e.g. after the upstream repo or branch is renamed
+http_client = httpx.AsyncClient(timeout=15, follow_redirects=True)
+
+def rows_to_articles(rows):
+    """Map article rows to dicts; map/zip keep the per-row work in C"""
+    return list(map(dict, map(zip, repeat(ARTICLE_KEYS), rows)))
+
+def build_fts_query(search):
+    """Turn free text into an FTS5 query matching every word; a trailing * keeps prefix matching"""
+    terms = []
+    for word in search.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"*' if prefix else f'"{word}"')
+    return " ".join(terms)
+
+def like_prefix(search):
+    """Return a LIKE pattern for a 'foo*' prefix search, or None for anything else"""
+    if not search.endswith("*") or "*" in search[:-1]:
+        return None
+    prefix = search[:-1].replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return prefix + "%" if prefix else None
+
+async def query_articles(conn, source, search, limit):
+    """Run the /articles query"""
+    params = [source] if source else []
+    if not search:
+        return await conn.execute_fetchall(SQL_ARTICLES[(bool(source), False)], params + [limit])
+
+    # Every term is quoted, so the MATCH string is always valid FTS5. It's only
+    # empty when the search has no words (e.g. just whitespace or *)
+    fts_query = build_fts_query(search)
+    if fts_query:
+        try:
+            return await conn.execute_fetchall(SQL_ARTICLES[(bool(source), True)], params + [fts_query, limit])
+        except sqlite3.OperationalError:
+            # No news_fts in this file (SQLite built without FTS5); use LIKE below
+            pass
+
+    prefix = like_prefix(search)
+    if prefix:
+        return await conn.execute_fetchall(SQL_ARTICLES_PREFIX[bool(source)], params + [prefix, limit])
+
+    pattern = f"%{search}%"
+    return await conn.execute_fetchall(SQL_ARTICLES_LIKE[bool(source)], params + [pattern, pattern, limit])
+
+async def query_stats(conn):
+    """Compute /articles/stats in two statements"""
+    rows = await conn.execute_fetchall(SQL_STATS_SUMMARY)
+    total, last_updated, first_article = rows[0]
+    by_source = [{"source": row[0], "count": row[1]} for row in await conn.execute_fetchall(SQL_STATS_BY_SOURCE)]
 
-    current_time = time.time()
+    return {
+        "total_articles": total,
+        "articles_by_source": by_source,
+        "last_updated": last_updated,
+        "first_article": first_article
+    }
 
-    # Use cached database if recent
-    if os.path.exists(DB_CACHE_FILE) and (current_time - last_fetch_time) < CACHE_DURATION:
-        return sqlite3.connect(DB_CACHE_FILE)
+async def swap_connection():
+    """Point the shared connection at the current cache file"""
+    global _conn, _retired_conn, _cached_stats, _sources_body, _stats_body, _source_names, _db_version
 
-    # Fetch fresh database from GitHub (raw URL - no rate limits!)
+    new_conn = await connect_db()
     try:
-        response = requests.get(DB_DOWNLOAD_URL, timeout=15)
-        response.raise_for_status()
+        # Pre-aggregate the endpoints that only change when the file does
+        sources = [row[0] for row in await new_conn.execute_fetchall(SQL_SOURCES)]
+        stats = await query_stats(new_conn)
+    except BaseException:
+        await new_conn.close()
+        raise
+
+    # Publish the connection and everything derived from it together, with
+    # no await in between, so no request sees new aggregates with the old file
+    closing_conn = _retired_conn
+    _retired_conn = _conn
+    _conn = new_conn
+    _cached_stats = stats
+    _stats_body = orjson.dumps(stats)
+    _sources_body = orjson.dumps({"total_sources": len(sources), "sources": sources})
+    _source_names = frozenset(sources)
+    _db_version += 1
+
+    # Close the connection retired on the previous swap; the one just
+    # replaced stays open for a grace period in case it's still in use
+    if closing_conn is not None:
+        await closing_conn.close()
+    return new_conn
+
+async def current_connection():
+    """Return the shared connection, opening it on first use"""
+    if _conn is not None:
+        return _conn
+    return await swap_connection()
+
+async def get_db():
+    """Download database from GitHub with caching (uses raw URL, no API limits)"""
+    global last_fetch_time, db_etag, db_last_modified, _cache_valid
+
+    # Hot path: no lock and no filesystem check while the cache is fresh
+    if _cache_valid and (time.time() - last_fetch_time) < CACHE_DURATION:
+        return _conn
+
+    # Another request is already refreshing; serve the current data rather than queue behind it
+    if _conn is not None and _refresh_lock.locked():
+        return _conn
 
-        # Save binary content directly
-        with open(DB_CACHE_FILE, 'wb') as f:
-            f.write(response.content)
+    async with _refresh_lock:
+        current_time = time.time()
 
-        last_fetch_time = current_time
-        return sqlite3.connect(DB_CACHE_FILE)
+        # Another request may have refreshed while we waited for the lock
+        if _cache_valid and (current_time - last_fetch_time) < CACHE_DURATION:
+            return _conn
 
-    except requests.exceptions.RequestException as e:
-        # If download fails but cache exists, use cache
+        # Fetch fresh database from GitHub (raw URL - no rate limits!)
+        headers = {}
         if os.path.exists(DB_CACHE_FILE):
-            return sqlite3.connect(DB_CACHE_FILE)
-        raise HTTPException(status_code=500, detail=f"Failed to fetch database: {str(e)}")
+            if db_etag:
+                headers["If-None-Match"] = db_etag
+            if db_last_modified:
+                headers["If-Modified-Since"] = db_last_modified
+
+        try:
+            async with http_client.stream("GET", DB_DOWNLOAD_URL, headers=headers) as response:
+                # Unchanged upstream: keep serving the current file
+                if response.status_code == 304:
+                    conn = await current_connection()
+                    last_fetch_time = current_time
+                    _cache_valid = True
+                    return conn
+
+                response.raise_for_status()
+
+                # Stream to a temp file and swap it in, so the shared connection
+                # never sees the cache file truncated underneath it
+                tmp_file = DB_CACHE_FILE + ".tmp"
+                try:
+                    with open(tmp_file, 'wb') as f:
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                    await bootstrap_db(tmp_file)
+                    os.replace(tmp_file, DB_CACHE_FILE)
+                finally:
+                    # Don't leave a partial copy behind (it may be sitting in /dev/shm)
+                    if os.path.exists(tmp_file):
+                        os.remove(tmp_file)
+
+                db_etag = response.headers.get("ETag")
+                db_last_modified = response.headers.get("Last-Modified")
+                save_db_meta(db_etag, db_last_modified)
+
+            conn = await swap_connection()
+            last_fetch_time = current_time
+            _cache_valid = True
+            return conn
+
+        except (httpx.HTTPError, sqlite3.DatabaseError, OSError) as e:
+            # Download failed or the body isn't a usable database; if cache exists, use cache
+            # and back off until the next refresh window instead of retrying per request
+            if os.path.exists(DB_CACHE_FILE):
+                conn = await current_connection()
+                last_fetch_time = current_time
+                _cache_valid = True
+                return conn
+            raise HTTPException(status_code=500, detail=f"Failed to fetch database: {str(e)}")
+
+@asynccontextmanager
+async def lifespan(app):
+    """Open the shared connection (and its PRAGMAs) once at startup"""
+    try:
+        await get_db()
+    except (HTTPException, sqlite3.DatabaseError, OSError):
+        # No usable cache and no usable download; requests will retry
+        pass
+    yield
+    for conn in (_conn, _retired_conn):
+        if conn is not None:
+            await conn.close()
+    await http_client.aclose()
 
-@app.api_route("/", methods=["GET", "HEAD"])
-async def root(request: Request):
-    if request.method == "HEAD":
-        return Response()
+app = FastAPI(
+    title="News Scraper API",
+    description="REST API for accessing scraped news articles",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Article lists compress well; small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+@app.get("/")
+async def root():
     return {
         "message": "News Scraper API - Live news from multiple sources",
         "version": "1.0.0",
@@ -74,135 +380,128 @@ async def root(request: Request):
         }
     }
 
-@app.api_route("/health", methods=["GET", "HEAD"])
-async def health_check(request: Request):
-    if request.method == "HEAD":
-        return Response()
+@app.get("/health")
+async def health_check():
     return {"status": "healthy"}
 
-@app.api_route("/articles", methods=["GET", "HEAD"])
+def etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header (a list of ETags, or *) against etag"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in tags)
+
+def articles_cache_headers(limit, source, search):
+    """ETag and Cache-Control for an /articles query"""
+    # Key on the connection swap as well as the newest article, so a refreshed
+    # file with extra rows but the same max(scraped_at) still changes the tag
+    last_updated = _cached_stats["last_updated"]
+    digest = hashlib.blake2b(
+        f"{_db_version}|{last_updated}|{limit}|{source}|{search}".encode(), digest_size=8
+    ).hexdigest()
+    # Weak, since GZipMiddleware may send this body gzipped or as-is under the same tag
+    return {"ETag": f'W/"{digest}"', "Cache-Control": f"public, max-age={CACHE_DURATION}"}
+
+@app.get("/articles")
 async def get_articles(
-    request: Request,
     limit: int = Query(50, ge=1, le=1000),
     source: Optional[str] = Query(None),
-    search: Optional[str] = Query(None)
+    search: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None)
 ):
-    if request.method == "HEAD":
-        return Response()
-
-    conn = get_db()
-    cursor = conn.cursor()
-
-    # MODIFICATION 1: Change 'summary' to 'summary AS content'
-    query = "SELECT id, source, title, url, summary AS content, image_url, scraped_at FROM news WHERE 1=1"
-    params = []
-
-    if source:
-        query += " AND source = ?"
-        params.append(source)
-
-    if search:
-        # Note: The search still uses 'summary' for the database query, but the output key is 'content'
-        query += " AND (title LIKE ? OR summary LIKE ?)" 
-        params.extend([f"%{search}%", f"%{search}%"])
+    conn = await get_db()
 
-    query += " ORDER BY scraped_at DESC LIMIT ?"
-    params.append(limit)
+    headers = articles_cache_headers(limit, source, search)
 
-    cursor.execute(query, params)
-    columns = [desc[0] for desc in cursor.description]
-    results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
 
-    conn.close()
+    rows = await query_articles(conn, source, search, limit)
+    results = rows_to_articles(rows)
 
-    return {
+    body = orjson.dumps({
         "total": len(results),
         "filters": {"limit": limit, "source": source, "search": search},
         "articles": results
-    }
-
-@app.api_route("/articles/latest", methods=["GET", "HEAD"])
-async def get_latest_articles(request: Request, limit: int = Query(10, ge=1, le=100)):
-    if request.method == "HEAD":
-        return Response()
-
-    conn = get_db()
-    cursor = conn.cursor()
-
-    cursor.execute(
-        # MODIFICATION 2: Change 'summary' to 'summary AS content'
-        "SELECT id, source, title, url, summary AS content, image_url, scraped_at FROM news ORDER BY scraped_at DESC LIMIT ?",
-        (limit,)
-    )
-
-    columns = [desc[0] for desc in cursor.description]
-    results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-    conn.close()
-
-    return {"total": len(results), "articles": results}
+    })
+    return Response(content=body, media_type="application/json", headers=headers)
 
-@app.api_route("/articles/sources", methods=["GET", "HEAD"])
-async def get_sources(request: Request):
-    if request.method == "HEAD":
-        return Response()
+@app.get("/articles/latest")
+async def get_latest_articles(limit: int = Query(10, ge=1, le=100)):
+    conn = await get_db()
 
-    conn = get_db()
-    cursor = conn.cursor()
+    key = (_db_version, "latest", limit)
+    body = response_cache.get(key)
+    if body is None:
+        rows = await conn.execute_fetchall(SQL_LATEST, (limit,))
+        results = rows_to_articles(rows)
+        body = response_cache[key] = orjson.dumps({"total": len(results), "articles": results})
 
-    cursor.execute("SELECT DISTINCT source FROM news ORDER BY source")
-    sources = [row[0] for row in cursor.fetchall()]
-    conn.close()
+    return Response(content=body, media_type="application/json")
 
-    return {"total_sources": len(sources), "sources": sources}
+@app.get("/articles/sources")
+async def get_sources():
+    # Refreshes the cache if needed; the body itself was encoded on refresh
+    await get_db()
+    return Response(content=_sources_body, media_type="application/json")
 
-@app.api_route("/articles/stats", methods=["GET", "HEAD"])
-async def get_stats(request: Request):
-    if request.method == "HEAD":
-        return Response()
+@app.get("/articles/stats")
+async def get_stats():
+    await get_db()
+    return Response(content=_stats_body, media_type="application/json")
 
-    conn = get_db()
-    cursor = conn.cursor()
+@app.get("/articles/by-source/{source_name}")
+async def get_articles_by_source(source_name: str, limit: int = Query(50, ge=1, le=500)):
+    conn = await get_db()
 
-    cursor.execute("SELECT COUNT(*) FROM news")
-    total = cursor.fetchone()[0]
+    rows = await conn.execute_fetchall(SQL_BY_SOURCE, (source_name, limit))
+    results = rows_to_articles(rows)
 
-    cursor.execute("SELECT source, COUNT(*) as count FROM news GROUP BY source ORDER BY count DESC")
-    by_source = [{"source": row[0], "count": row[1]} for row in cursor.fetchall()]
-
-    cursor.execute("SELECT MAX(scraped_at) FROM news")
-    last_updated = cursor.fetchone()[0]
-
-    cursor.execute("SELECT MIN(scraped_at) FROM news")
-    first_article = cursor.fetchone()[0]
-
-    conn.close()
+    if not results:
+        raise HTTPException(status_code=404, detail=f"No articles found for source: {source_name}")
 
-    return {
-        "total_articles": total,
-        "articles_by_source": by_source,
-        "last_updated": last_updated,
-        "first_article": first_article
-    }
+    return {"source": source_name, "total": len(results), "articles": results}
 
-@app.api_route("/articles/by-source/{source_name}", methods=["GET", "HEAD"])
-async def get_articles_by_source(request: Request, source_name: str, limit: int = Query(50, ge=1, le=500)):
-    if request.method == "HEAD":
-        return Response()
+# HEAD handlers answer without running the GET queries. /articles and
+# /articles/by-source get their own so headers and 404s match GET.
 
-    conn = get_db()
-    cursor = conn.cursor()
+@app.head("/articles", include_in_schema=False)
+async def head_articles(
+    limit: int = Query(50, ge=1, le=1000),
+    source: Optional[str] = Query(None),
+    search: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None)
+):
+    await get_db()
 
-    cursor.execute(
-        # MODIFICATION 3: Change 'summary' to 'summary AS content'
-        "SELECT id, source, title, url, summary AS content, image_url, scraped_at FROM news WHERE source = ? ORDER BY scraped_at DESC LIMIT ?",
-        (source_name, limit)
-    )
+    headers = articles_cache_headers(limit, source, search)
+    status_code = 304 if etag_matches(if_none_match, headers["ETag"]) else 200
+    return Response(status_code=status_code, headers=headers)
 
-    columns = [desc[0] for desc in cursor.description]
-    results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-    conn.close()
+@app.head("/articles/by-source/{source_name}", include_in_schema=False)
+async def head_articles_by_source(source_name: str, limit: int = Query(50, ge=1, le=500)):
+    await get_db()
 
-    if not results:
+    if source_name not in _source_names:
         raise HTTPException(status_code=404, detail=f"No articles found for source: {source_name}")
 
-    return {"source": source_name, "total": len(results), "articles": results}
+    return Response()
+
+@app.api_route("/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def fallback(request: Request):
+    # Must stay registered last. A GET that reaches here matched no real route;
+    # answering it keeps unknown paths a 404 rather than a 405 from this route
+    if request.method == "GET":
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    # HEAD: empty 200 if a GET route serves this path and its query params
+    # validate (422 otherwise, as GET would), 404 if none does
+    scope = dict(request.scope, method="GET")
+    for route in app.router.routes:
+        if getattr(route, "endpoint", None) is not fallback and route.matches(scope)[0] == Match.FULL:
+            if isinstance(route, APIRoute):
+                _, errors = request_params_to_args(route.dependant.query_params, request.query_params)
+                if errors:
+                    raise RequestValidationError(errors)
+            return Response()
+    return Response(status_code=404)